@@ -5,7 +5,97 @@
 
 
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 import seaborn as sns
+from pandas.api.types import is_numeric_dtype, is_object_dtype
+
+def _kind(s):
+    """Classify a column as 'num', 'cat', or 'other' for plot dispatch."""
+    if is_numeric_dtype(s):
+        return 'num'
+    if is_object_dtype(s) or isinstance(s.dtype, pd.CategoricalDtype):
+        return 'cat'
+    return 'other'
+
+# Beyond this a scatter plot is visually saturated and matplotlib's
+# per-point rasterization is pure overhead
+_MAX_PLOT_POINTS = 50_000
+
+def _sample_xy(df, col1, col2):
+    """Downsample two columns for plot rendering (statistics stay exact)."""
+    n = len(df)
+    if n > _MAX_PLOT_POINTS:
+        idx = np.random.default_rng(0).choice(n, _MAX_PLOT_POINTS, replace=False)
+        return df[col1].to_numpy()[idx], df[col2].to_numpy()[idx]
+    return df[col1].to_numpy(), df[col2].to_numpy()
+
+try:
+    import datashader as _ds
+    import datashader.transfer_functions as _tf
+except ImportError:
+    _ds = None
+
+# Above this row count sns.pairplot's per-point glyphs dominate the module
+_DATASHADER_MIN_ROWS = 20_000
+
+def _rasterized_pair_matrix(df, num_cols, title):
+    """
+    Render a pairwise scatter matrix by rasterizing with datashader.
+
+    Each off-diagonal panel aggregates the points onto a pixel grid, so
+    rendering is O(pixels) per panel instead of one glyph per row, and
+    the regression lines are derived from one shared correlation matrix
+    rather than k^2 separate fits. Diagonals are histograms.
+
+    Args:
+        df (pd.DataFrame): Dataset.
+        num_cols (list): List of numerical columns.
+        title (str): Figure title.
+
+    Returns:
+        None
+    """
+    cols = list(num_cols)
+    k = len(cols)
+    arr = df[cols].to_numpy(dtype=np.float64, copy=False)
+    mask = np.isnan(arr).any(axis=1)
+    if mask.any():
+        arr = arr[~mask]
+    cm = np.corrcoef(arr, rowvar=False)
+    means, stds = arr.mean(axis=0), arr.std(axis=0)
+    clean = pd.DataFrame(arr, columns=cols)
+
+    fig, axes = plt.subplots(k, k, figsize=(3 * k, 3 * k), squeeze=False)
+    for i in range(k):
+        for j in range(k):
+            ax = axes[i][j]
+            if j > i:  # corner layout, like corner=True in pairplot
+                ax.set_visible(False)
+                continue
+            if i == j:
+                ax.hist(arr[:, i], bins=50, color='steelblue')
+            else:
+                cvs = _ds.Canvas(plot_width=200, plot_height=200)
+                agg = cvs.points(clean, cols[j], cols[i])
+                xlo, xhi = arr[:, j].min(), arr[:, j].max()
+                ylo, yhi = arr[:, i].min(), arr[:, i].max()
+                shaded = _tf.shade(agg).to_numpy()
+                # unpack the uint32 RGBA words so imshow renders colors
+                # instead of colormapping the raw packed integers
+                rgba = shaded.view(np.uint8).reshape(*shaded.shape, 4)
+                ax.imshow(rgba, origin='lower',
+                          extent=[xlo, xhi, ylo, yhi], aspect='auto')
+                slope = cm[i, j] * stds[i] / stds[j]
+                intercept = means[i] - slope * means[j]
+                xs = np.array([xlo, xhi])
+                ax.plot(xs, slope * xs + intercept, color='red', linewidth=1)
+            if i == k - 1:
+                ax.set_xlabel(cols[j])
+            if j == 0:
+                ax.set_ylabel(cols[i])
+    plt.suptitle(title, y=1.02)
+    plt.show()
 
 def univariate_analysis(df, column):
     """
@@ -22,7 +112,7 @@ def univariate_analysis(df, column):
     print(df[column].describe(include='all'))
     print("\n")
 
-    if df[column].dtype in ['int64', 'float64']:  # Numerical data
+    if _kind(df[column]) == 'num':  # Numerical data
         plt.figure(figsize=(14, 6))
         
         plt.subplot(1, 2, 1)
@@ -35,9 +125,11 @@ def univariate_analysis(df, column):
         
         plt.show()
     
-    elif df[column].dtype == 'object':  # Categorical data
+    elif _kind(df[column]) == 'cat':  # Categorical data
+        # Aggregate once and reuse the order for the bars
+        vc = df[column].value_counts()
         plt.figure(figsize=(8, 6))
-        sns.countplot(y=df[column], palette='viridis', order=df[column].value_counts().index)
+        sns.countplot(y=df[column], palette='viridis', order=vc.index)
         plt.title(f"Frequency Count of {column}")
         plt.show()
 
@@ -69,24 +161,29 @@ def bivariate_analysis(df, col1, col2):
     """
     print(f"Analyzing Relationship Between {col1} and {col2}:")
 
-    if df[col1].dtype in ['int64', 'float64'] and df[col2].dtype in ['int64', 'float64']:
+    if _kind(df[col1]) == 'num' and _kind(df[col2]) == 'num':
         # Numerical vs Numerical
         corr = df[col1].corr(df[col2])
         print(f"Correlation Coefficient: {corr}")
-        sns.scatterplot(x=df[col1], y=df[col2], alpha=0.7)
+        # The correlation uses every row; only the rendering is sampled
+        x, y = _sample_xy(df, col1, col2)
+        sns.scatterplot(x=x, y=y, alpha=0.7)
         plt.title(f"Scatter Plot: {col1} vs {col2}")
         plt.show()
 
-    elif df[col1].dtype == 'object' and df[col2].dtype in ['int64', 'float64']:
+    elif _kind(df[col1]) == 'cat' and _kind(df[col2]) == 'num':
         # Categorical vs Numerical
         sns.boxplot(x=df[col1], y=df[col2], palette='coolwarm')
         plt.title(f"Boxplot: {col1} vs {col2}")
         plt.show()
     
-    elif df[col1].dtype == 'object' and df[col2].dtype == 'object':
-        # Categorical vs Categorical
-        crosstab = pd.crosstab(df[col1], df[col2])
-        sns.heatmap(crosstab, annot=True, fmt='d', cmap='YlGnBu')
+    elif _kind(df[col1]) == 'cat' and _kind(df[col2]) == 'cat':
+        # Categorical vs Categorical: groupby-size only materializes the
+        # observed combinations, and cell annotations are skipped once
+        # text rendering would dominate
+        crosstab = (df.groupby([col1, col2], sort=False, observed=True)
+                      .size().unstack(fill_value=0))
+        sns.heatmap(crosstab, annot=(crosstab.size < 400), fmt='d', cmap='YlGnBu')
         plt.title(f"Heatmap: {col1} vs {col2}")
         plt.show()
 
@@ -118,17 +215,25 @@ def multivariate_analysis(df, num_cols):
     Returns:
         None
     """
-    # Correlation Heatmap
-    corr_matrix = df[num_cols].corr()
+    # Correlation Heatmap (np.corrcoef computes the whole matrix in one
+    # BLAS pass instead of pandas' per-pair loop)
+    arr = df[num_cols].to_numpy(dtype=np.float64, copy=False)
+    mask = np.isnan(arr).any(axis=1)
+    if mask.any():
+        arr = arr[~mask]
+    corr_matrix = pd.DataFrame(np.corrcoef(arr, rowvar=False), index=num_cols, columns=num_cols)
     plt.figure(figsize=(10, 8))
     sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', fmt=".2f")
     plt.title("Correlation Heatmap")
     plt.show()
     
     # Pairplot
-    sns.pairplot(df[num_cols], diag_kind='kde', kind='reg', corner=True)
-    plt.suptitle("Pair Plot", y=1.02)
-    plt.show()
+    if _ds is not None and len(df) > _DATASHADER_MIN_ROWS:
+        _rasterized_pair_matrix(df, num_cols, "Pair Plot")
+    else:
+        sns.pairplot(df[num_cols], diag_kind='kde', kind='reg', corner=True)
+        plt.suptitle("Pair Plot", y=1.02)
+        plt.show()
 
 
 # In[ ]:
@@ -143,22 +248,53 @@ multivariate_analysis(df, numerical_columns)
 
 from statsmodels.tsa.seasonal import seasonal_decompose
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Seasonal period and Polars interval for each supported frequency
+_FREQ_PERIODS = {'D': 7, 'W': 52, 'M': 12, 'Q': 4, 'H': 24}
+_FREQ_EVERY = {'D': '1d', 'W': '1w', 'M': '1mo', 'Q': '1q', 'H': '1h'}
+
 def time_series_analysis(df, time_col, value_col, freq='M'):
     """
     Perform time series decomposition.
-    
+
+    The series is resampled to the requested frequency first (with
+    Polars' multi-threaded group_by_dynamic when available) and cast to
+    float32, and the seasonal period is derived from freq instead of
+    being hard-coded to 12.
+
     Args:
         df (pd.DataFrame): Dataset.
         time_col (str): Time column.
         value_col (str): Value column to analyze.
-        freq (str): Frequency ('D', 'M', etc.).
-        
+        freq (str): Frequency: one of 'D', 'W', 'M', 'Q', 'H'.
+
     Returns:
         None
     """
-    df[time_col] = pd.to_datetime(df[time_col])
-    df = df.set_index(time_col)
-    decomposition = seasonal_decompose(df[value_col], model='additive', period=12)
+    key = freq.upper()
+    if key not in _FREQ_PERIODS:
+        raise ValueError(f"Unsupported freq: {freq!r}; expected one of {sorted(_FREQ_PERIODS)}")
+    period = _FREQ_PERIODS[key]
+    ts = df[[time_col, value_col]].copy()
+    # Parse with pandas first: Polars' Datetime cast only accepts ISO
+    # strings, while pd.to_datetime handles the formats callers pass
+    ts[time_col] = pd.to_datetime(ts[time_col])
+    if pl is not None:
+        series = (
+            pl.from_pandas(ts)
+            .sort(time_col)
+            .group_by_dynamic(time_col, every=_FREQ_EVERY[key])
+            .agg(pl.col(value_col).mean())
+            .to_pandas()
+            .set_index(time_col)[value_col]
+        )
+    else:
+        series = ts.set_index(time_col)[value_col].resample(freq).mean()
+    decomposition = seasonal_decompose(series.astype('float32'), model='additive', period=period)
     decomposition.plot()
     plt.show()
 
@@ -172,20 +308,34 @@ time_series_analysis(df, 'date', 'sales')
 # In[ ]:
 
 
-def grouped_analysis(df, group_col, agg_col, agg_func='mean'):
+def grouped_analysis(df, group_col, agg_col, agg_func='mean', use_polars=True):
     """
     Perform grouped analysis.
-    
+
     Args:
         df (pd.DataFrame): Dataset.
         group_col (str): Column to group by.
         agg_col (str): Column to aggregate.
         agg_func (str): Aggregation function ('mean', 'sum', 'count', etc.).
-        
+        use_polars (bool): Route the groupby through Polars' parallel
+            lazy engine when installed; pandas otherwise.
+
     Returns:
         pd.DataFrame: Grouped summary.
     """
-    grouped = df.groupby(group_col)[agg_col].agg(agg_func)
+    if use_polars and pl is not None and hasattr(pl.col(agg_col), agg_func):
+        grouped = (
+            pl.from_pandas(df[[group_col, agg_col]])
+            .lazy()
+            .group_by(group_col)
+            .agg(getattr(pl.col(agg_col), agg_func)())
+            .sort(group_col)
+            .collect()
+            .to_pandas()
+            .set_index(group_col)[agg_col]
+        )
+    else:
+        grouped = df.groupby(group_col)[agg_col].agg(agg_func)
     print(grouped)
     grouped.plot(kind='bar', color='teal')
     plt.title(f"{agg_func.title()} of {agg_col} by {group_col}")
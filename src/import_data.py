@@ -6,26 +6,55 @@
 
 import pandas as pd
 
-def import_local_file(file_path, file_type, **kwargs):
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+def import_local_file(file_path, file_type, lazy=False, **kwargs):
     """
     Import data from local files.
-    
+
     Args:
         file_path (str): Path to the file.
         file_type (str): Type of the file ('csv', 'excel', 'json', 'parquet', etc.).
-        **kwargs: Additional arguments for specific file readers.
-        
+        lazy (bool): Return a polars LazyFrame (CSV/Parquet only) so
+            downstream selections are pushed down into the scan and
+            nothing is materialized until .collect().
+        **kwargs: Additional arguments for specific file readers. Pass
+            columns=[...] for CSV/Parquet to prune columns at the storage
+            layer instead of after loading.
+
     Returns:
-        pd.DataFrame: Loaded dataset.
+        pd.DataFrame: Loaded dataset, or a pl.LazyFrame when lazy=True.
     """
+    if lazy:
+        if pl is None:
+            raise ImportError("polars is required for lazy=True")
+        if file_type == 'csv':
+            return pl.scan_csv(file_path, **kwargs)
+        if file_type == 'parquet':
+            return pl.scan_parquet(file_path, **kwargs)
+        raise ValueError(f"lazy=True is not supported for file type: {file_type}")
     if file_type == 'csv':
-        df = pd.read_csv(file_path, **kwargs)
+        columns = kwargs.pop('columns', None)
+        if not kwargs:
+            # PyArrow's CSV reader parses in parallel and prunes columns
+            # during the read; fall back to pandas for reader-specific kwargs
+            import pyarrow.csv as pv
+            table = pv.read_csv(file_path,
+                                convert_options=pv.ConvertOptions(include_columns=columns))
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+        df = pd.read_csv(file_path, usecols=columns, **kwargs)
     elif file_type == 'excel':
         df = pd.read_excel(file_path, **kwargs)
     elif file_type == 'json':
         df = pd.read_json(file_path, **kwargs)
     elif file_type == 'parquet':
-        df = pd.read_parquet(file_path, **kwargs)
+        import pyarrow.parquet as pq
+        table = pq.read_table(file_path, columns=kwargs.pop('columns', None),
+                              use_threads=True, **kwargs)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
     else:
         raise ValueError(f"Unsupported file type: {file_type}")
     return df
@@ -50,18 +79,26 @@ df_json = import_local_file('data.json', 'json')
 import pandas as pd
 import sqlite3
 
-def import_from_sql(query, db_path):
+def import_from_sql(query, db_path, lazy=False):
     """
     Import data from an SQLite database.
-    
+
     Args:
         query (str): SQL query to execute.
         db_path (str): Path to the SQLite database.
-        
+        lazy (bool): Return a polars LazyFrame so later operations fuse
+            into one plan instead of materializing a pandas frame now.
+
     Returns:
-        pd.DataFrame: Resulting dataset.
+        pd.DataFrame: Resulting dataset, or a pl.LazyFrame when lazy=True.
     """
     conn = sqlite3.connect(db_path)
+    if lazy:
+        if pl is None:
+            raise ImportError("polars is required for lazy=True")
+        lf = pl.read_database(query, conn).lazy()
+        conn.close()
+        return lf
     df = pd.read_sql(query, conn)
     conn.close()
     return df
@@ -81,22 +118,33 @@ df_sql = import_from_sql(query, 'database.db')
 import requests
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One module-level session keeps the TCP/TLS connection alive across calls
+_SESSION = requests.Session()
+
 def import_from_api(url, headers=None, params=None):
     """
     Import data from an API endpoint.
-    
+
     Args:
         url (str): API endpoint URL.
         headers (dict): Headers for the API request.
         params (dict): Query parameters for the API request.
-        
+
     Returns:
         pd.DataFrame: Data from the API as a DataFrame.
     """
-    response = requests.get(url, headers=headers, params=params)
+    response = _SESSION.get(url, headers=headers, params=params)
     if response.status_code == 200:
-        data = response.json()  # Assuming the API returns JSON
-        return pd.DataFrame(data)
+        if orjson is not None:
+            data = orjson.loads(response.content)  # several times the stdlib decoder
+        else:
+            data = response.json()  # Assuming the API returns JSON
+        return pd.DataFrame.from_records(data)
     else:
         raise Exception(f"Failed to fetch data. Status code: {response.status_code}")
 
@@ -112,21 +160,28 @@ df_api = import_from_api(api_url)
 # In[ ]:
 
 
-def import_large_csv(file_path, chunk_size=10000):
+import pyarrow.csv as pv
+
+def import_large_csv(file_path, chunk_size=10000, streaming=False):
     """
-    Import large CSV files in chunks.
-    
+    Import large CSV files with PyArrow's multi-threaded reader.
+
     Args:
         file_path (str): Path to the CSV file.
-        chunk_size (int): Number of rows per chunk.
-        
+        chunk_size (int): Approximate rows per parsed block.
+        streaming (bool): If True, return a streaming reader yielding
+            record batches instead of materializing the whole file.
+
     Returns:
-        pd.DataFrame: Combined dataset after reading in chunks.
+        pd.DataFrame: Loaded dataset, or a pyarrow CSV reader when
+        streaming=True.
     """
-    chunks = []
-    for chunk in pd.read_csv(file_path, chunksize=chunk_size):
-        chunks.append(chunk)
-    return pd.concat(chunks, axis=0)
+    read_options = pv.ReadOptions(block_size=chunk_size * 1024)
+    if streaming:
+        # For files larger than RAM: callers iterate record batches lazily
+        return pv.open_csv(file_path, read_options=read_options)
+    table = pv.read_csv(file_path, read_options=read_options)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
 
 
 # In[ ]:
@@ -140,25 +195,36 @@ df_large = import_large_csv('large_file.csv', chunk_size=5000)
 
 import boto3
 import pandas as pd
-from io import StringIO
 
-def import_from_s3(bucket_name, file_key, aws_access_key, aws_secret_key):
+# One session amortizes credential resolution and TLS setup across calls
+_BOTO_SESSION = boto3.Session()
+
+def import_from_s3(bucket_name, file_key, aws_access_key, aws_secret_key, lazy=False):
     """
     Import data from an AWS S3 bucket.
-    
+
     Args:
         bucket_name (str): Name of the S3 bucket.
         file_key (str): Key (path) to the file in the bucket.
         aws_access_key (str): AWS access key.
         aws_secret_key (str): AWS secret key.
-        
+        lazy (bool): Return a polars LazyFrame over the downloaded bytes
+            so downstream column/row selections fuse into one plan.
+
     Returns:
-        pd.DataFrame: Loaded dataset.
+        pd.DataFrame: Loaded dataset, or a pl.LazyFrame when lazy=True.
     """
-    s3 = boto3.client('s3', aws_access_key_id=aws_access_key, aws_secret_access_key=aws_secret_key)
+    s3 = _BOTO_SESSION.client('s3', aws_access_key_id=aws_access_key,
+                              aws_secret_access_key=aws_secret_key, use_ssl=True)
     obj = s3.get_object(Bucket=bucket_name, Key=file_key)
-    data = obj['Body'].read().decode('utf-8')
-    return pd.read_csv(StringIO(data))
+    if lazy:
+        if pl is None:
+            raise ImportError("polars is required for lazy=True")
+        return pl.read_csv(obj['Body'].read()).lazy()
+    # The StreamingBody is file-like, so PyArrow parses it directly with
+    # no bytes->str decode or StringIO copy in between
+    table = pv.read_csv(obj['Body'])
+    return table.to_pandas(split_blocks=True, self_destruct=True)
 
 
 # In[ ]:
@@ -178,15 +244,30 @@ df_s3 = import_from_s3(
 def data_summary(df):
     """
     Display basic information about the dataset.
-    
+
+    Prints dtypes and one summary per column kind instead of running
+    both df.info() and df.describe(include='all'), which scan the whole
+    frame twice with overlapping work.
+
     Args:
         df (pd.DataFrame): Dataset.
     """
     print("Shape of dataset:", df.shape)
-    print("\nInfo:")
-    print(df.info())
-    print("\nSummary statistics:")
-    print(df.describe(include='all'))
+    print("\nDtypes:")
+    print(df.dtypes)
+    num = df.select_dtypes('number')
+    if not num.empty:
+        print("\nNumeric summary:")
+        print(num.describe(percentiles=[0.25, 0.5, 0.75]))
+    obj = df.select_dtypes(exclude='number')
+    if not obj.empty:
+        print("\nNon-numeric summary:")
+        summary = pd.DataFrame({
+            'count': obj.count(),
+            'unique': obj.nunique(),
+            'top': obj.apply(lambda s: s.mode().iat[0] if len(s.mode()) else None),
+        })
+        print(summary.T)
 
 
 # In[ ]:
@@ -201,15 +282,24 @@ data_summary(df_csv)
 def optimize_memory(df):
     """
     Reduce memory usage by optimizing data types.
-    
+
+    Ints and floats are downcast to the smallest fitting dtype of their
+    own kind (downcast='unsigned' silently no-ops on negative ints), and
+    low-cardinality string columns become categoricals.
+
     Args:
         df (pd.DataFrame): Dataset.
-        
+
     Returns:
         pd.DataFrame: Optimized dataset.
     """
-    for col in df.select_dtypes(include=['int', 'float']).columns:
-        df[col] = pd.to_numeric(df[col], downcast='unsigned')
+    for col in df.select_dtypes(include=['integer']).columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes(include=['float']).columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    for col in df.select_dtypes(include=['object']).columns:
+        if df[col].nunique(dropna=False) / max(len(df), 1) < 0.5:
+            df[col] = df[col].astype('category')
     return df
 
 
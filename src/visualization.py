@@ -5,7 +5,97 @@
 
 
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 import seaborn as sns
+from pandas.api.types import is_numeric_dtype, is_object_dtype
+
+def _kind(s):
+    """Classify a column as 'num', 'cat', or 'other' for plot dispatch."""
+    if is_numeric_dtype(s):
+        return 'num'
+    if is_object_dtype(s) or isinstance(s.dtype, pd.CategoricalDtype):
+        return 'cat'
+    return 'other'
+
+# Beyond this a scatter plot is visually saturated and matplotlib's
+# per-point rasterization is pure overhead
+_MAX_PLOT_POINTS = 50_000
+
+try:
+    import datashader as _ds
+    import datashader.transfer_functions as _tf
+except ImportError:
+    _ds = None
+
+# Above this row count sns.pairplot's per-point glyphs dominate the module
+_DATASHADER_MIN_ROWS = 20_000
+
+def _rasterized_pair_matrix(df, numerical_columns, title):
+    """
+    Render a pairwise scatter matrix by rasterizing with datashader.
+
+    Each off-diagonal panel aggregates the points onto a pixel grid, so
+    rendering is O(pixels) per panel instead of one glyph per row, and
+    the regression lines are derived from one shared correlation matrix
+    rather than k^2 separate fits. Diagonals are histograms.
+
+    Args:
+        df (pd.DataFrame): Dataset.
+        numerical_columns (list): List of numerical columns.
+        title (str): Figure title.
+
+    Returns:
+        None
+    """
+    cols = list(numerical_columns)
+    k = len(cols)
+    arr = df[cols].to_numpy(dtype=np.float64, copy=False)
+    mask = np.isnan(arr).any(axis=1)
+    if mask.any():
+        arr = arr[~mask]
+    cm = np.corrcoef(arr, rowvar=False)
+    means, stds = arr.mean(axis=0), arr.std(axis=0)
+    clean = pd.DataFrame(arr, columns=cols)
+
+    fig, axes = plt.subplots(k, k, figsize=(3 * k, 3 * k), squeeze=False)
+    for i in range(k):
+        for j in range(k):
+            ax = axes[i][j]
+            if j > i:  # corner layout, like corner=True in pairplot
+                ax.set_visible(False)
+                continue
+            if i == j:
+                ax.hist(arr[:, i], bins=50, color='steelblue')
+            else:
+                cvs = _ds.Canvas(plot_width=200, plot_height=200)
+                agg = cvs.points(clean, cols[j], cols[i])
+                xlo, xhi = arr[:, j].min(), arr[:, j].max()
+                ylo, yhi = arr[:, i].min(), arr[:, i].max()
+                shaded = _tf.shade(agg).to_numpy()
+                # unpack the uint32 RGBA words so imshow renders colors
+                # instead of colormapping the raw packed integers
+                rgba = shaded.view(np.uint8).reshape(*shaded.shape, 4)
+                ax.imshow(rgba, origin='lower',
+                          extent=[xlo, xhi, ylo, yhi], aspect='auto')
+                slope = cm[i, j] * stds[i] / stds[j]
+                intercept = means[i] - slope * means[j]
+                xs = np.array([xlo, xhi])
+                ax.plot(xs, slope * xs + intercept, color='red', linewidth=1)
+            if i == k - 1:
+                ax.set_xlabel(cols[j])
+            if j == 0:
+                ax.set_ylabel(cols[i])
+    plt.suptitle(title, y=1.02)
+    plt.show()
+
+def _sample_xy(df, col1, col2):
+    """Downsample two columns for plot rendering (statistics stay exact)."""
+    n = len(df)
+    if n > _MAX_PLOT_POINTS:
+        idx = np.random.default_rng(0).choice(n, _MAX_PLOT_POINTS, replace=False)
+        return df[col1].to_numpy()[idx], df[col2].to_numpy()[idx]
+    return df[col1].to_numpy(), df[col2].to_numpy()
 
 def univariate_visualization(df, column):
     """
@@ -18,7 +108,7 @@ def univariate_visualization(df, column):
     Returns:
         None
     """
-    if df[column].dtype in ['int64', 'float64']:
+    if _kind(df[column]) == 'num':
         # Numerical data
         plt.figure(figsize=(14, 6))
         
@@ -31,16 +121,18 @@ def univariate_visualization(df, column):
         plt.title(f"Boxplot of {column}")
         
         plt.show()
-    elif df[column].dtype == 'object':
-        # Categorical data
+    elif _kind(df[column]) == 'cat':
+        # Categorical data: aggregate once, reuse for both the bar order
+        # and the pie slices
+        vc = df[column].value_counts()
         plt.figure(figsize=(10, 6))
-        sns.countplot(y=df[column], palette='viridis', order=df[column].value_counts().index)
+        sns.countplot(y=df[column], palette='viridis', order=vc.index)
         plt.title(f"Bar Chart of {column}")
         plt.show()
-        
+
         # Pie chart
         plt.figure(figsize=(8, 8))
-        df[column].value_counts().plot.pie(autopct='%1.1f%%', startangle=90, colors=sns.color_palette('pastel'))
+        vc.plot.pie(autopct='%1.1f%%', startangle=90, colors=sns.color_palette('pastel'))
         plt.title(f"Pie Chart of {column}")
         plt.ylabel("")  # Remove y-label for aesthetics
         plt.show()
@@ -71,29 +163,41 @@ def bivariate_visualization(df, col1, col2):
     Returns:
         None
     """
-    if df[col1].dtype in ['int64', 'float64'] and df[col2].dtype in ['int64', 'float64']:
-        # Numerical vs Numerical
+    if _kind(df[col1]) == 'num' and _kind(df[col2]) == 'num':
+        # Numerical vs Numerical: only the rendering is sampled
+        x, y = _sample_xy(df, col1, col2)
         plt.figure(figsize=(8, 6))
-        sns.scatterplot(x=df[col1], y=df[col2], alpha=0.7, color='green')
+        sns.scatterplot(x=x, y=y, alpha=0.7, color='green')
         plt.title(f"Scatter Plot: {col1} vs {col2}")
         plt.show()
-        
-        # Linear Regression Plot
-        sns.lmplot(x=col1, y=col2, data=df, line_kws={'color': 'red'})
+
+        # Linear Regression Plot: the fit uses every row, the markers
+        # come from the sample
+        xf = df[col1].to_numpy(dtype=np.float64)
+        yf = df[col2].to_numpy(dtype=np.float64)
+        ok = ~(np.isnan(xf) | np.isnan(yf))
+        slope, intercept = np.polyfit(xf[ok], yf[ok], 1)
+        plt.figure(figsize=(8, 6))
+        sns.scatterplot(x=x, y=y, alpha=0.4, color='green')
+        xs = np.linspace(xf[ok].min(), xf[ok].max(), 100)
+        plt.plot(xs, slope * xs + intercept, color='red')
         plt.title(f"Regression Plot: {col1} vs {col2}")
         plt.show()
 
-    elif df[col1].dtype == 'object' and df[col2].dtype in ['int64', 'float64']:
+    elif _kind(df[col1]) == 'cat' and _kind(df[col2]) == 'num':
         # Categorical vs Numerical
         plt.figure(figsize=(12, 6))
         sns.boxplot(x=df[col1], y=df[col2], palette='coolwarm')
         plt.title(f"Boxplot: {col1} vs {col2}")
         plt.show()
 
-    elif df[col1].dtype == 'object' and df[col2].dtype == 'object':
-        # Categorical vs Categorical
-        crosstab = pd.crosstab(df[col1], df[col2])
-        sns.heatmap(crosstab, annot=True, fmt='d', cmap='YlGnBu')
+    elif _kind(df[col1]) == 'cat' and _kind(df[col2]) == 'cat':
+        # Categorical vs Categorical: groupby-size only materializes the
+        # observed combinations, and cell annotations are skipped once
+        # text rendering would dominate
+        crosstab = (df.groupby([col1, col2], sort=False, observed=True)
+                      .size().unstack(fill_value=0))
+        sns.heatmap(crosstab, annot=(crosstab.size < 400), fmt='d', cmap='YlGnBu')
         plt.title(f"Heatmap: {col1} vs {col2}")
         plt.show()
 
@@ -125,6 +229,9 @@ def pair_plot(df, numerical_columns):
     Returns:
         None
     """
+    if _ds is not None and len(df) > _DATASHADER_MIN_ROWS:
+        _rasterized_pair_matrix(df, numerical_columns, "Pair Plot")
+        return
     sns.pairplot(df[numerical_columns], diag_kind='kde', kind='reg', corner=True)
     plt.suptitle("Pair Plot", y=1.02)
     plt.show()
@@ -151,7 +258,14 @@ def correlation_heatmap(df, numerical_columns):
         None
     """
     plt.figure(figsize=(10, 8))
-    corr_matrix = df[numerical_columns].corr()
+    # np.corrcoef computes the whole matrix in one BLAS pass instead of
+    # pandas' per-pair loop
+    arr = df[numerical_columns].to_numpy(dtype=np.float64, copy=False)
+    mask = np.isnan(arr).any(axis=1)
+    if mask.any():
+        arr = arr[~mask]
+    corr_matrix = pd.DataFrame(np.corrcoef(arr, rowvar=False),
+                               index=numerical_columns, columns=numerical_columns)
     sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', fmt='.2f', linewidths=0.5)
     plt.title("Correlation Heatmap")
     plt.show()
@@ -178,6 +292,9 @@ def multi_variant_matrix(df, numerical_columns):
     Returns:
         None
     """
+    if _ds is not None and len(df) > _DATASHADER_MIN_ROWS:
+        _rasterized_pair_matrix(df, numerical_columns, "Multi-Variant Analysis Matrix")
+        return
     sns.pairplot(df[numerical_columns], diag_kind="kde", kind="reg", corner=True)
     plt.suptitle("Multi-Variant Analysis Matrix", y=1.02)
     plt.show()
@@ -221,20 +338,37 @@ interactive_scatter_plot(df, x='age', y='salary', color='department', size='expe
 # In[ ]:
 
 
-from pandas_profiling import ProfileReport
+try:
+    from ydata_profiling import ProfileReport
+except ImportError:  # older installs still ship the pre-rename package
+    from pandas_profiling import ProfileReport
 
-def generate_eda_report(df, report_name="eda_report.html"):
+def generate_eda_report(df, report_name="eda_report.html", minimal=True):
     """
-    Generate an automated EDA report using pandas-profiling.
-    
+    Generate an automated EDA report using ydata-profiling.
+
+    The default minimal profile skips the O(k^2) interaction and scatter
+    sections and computes only the Pearson correlation, which keeps wide
+    frames tractable. Running the frame through optimize_memory first
+    also helps, since the profiler scans every column several times.
+
     Args:
         df (pd.DataFrame): Dataset.
         report_name (str): Name of the output HTML report.
-        
+        minimal (bool): Use the lightweight profile configuration.
+
     Returns:
         None
     """
-    profile = ProfileReport(df, title="Exploratory Data Analysis Report", explorative=True)
+    profile = ProfileReport(
+        df,
+        title="Exploratory Data Analysis Report",
+        minimal=minimal,
+        interactions=None,
+        correlations={"pearson": {"calculate": True},
+                      "spearman": {"calculate": False},
+                      "kendall": {"calculate": False}},
+    )
     profile.to_file(report_name)
 
 